@@ -1,15 +1,20 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
 import pathlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
-import pooch
+if TYPE_CHECKING:
+    import pooch
 
 _version = "0"
 
 __all__ = ["small_mcstas_2_sample", "small_mcstas_3_sample", "get_path"]
 
 
-def _make_pooch() -> pooch.Pooch:
+def _make_pooch() -> 'pooch.Pooch':
+    import pooch
+
     return pooch.create(
         path=pooch.os_cache("essnmx"),
         env="ESSNMX_DATA_DIR",
@@ -24,7 +29,10 @@ def _make_pooch() -> pooch.Pooch:
     )
 
 
-_pooch = _make_pooch()
+@lru_cache(maxsize=1)
+def _get_pooch() -> 'pooch.Pooch':
+    """Create the pooch on first use, so importing the module stays cheap."""
+    return _make_pooch()
 
 
 def small_mcstas_2_sample():
@@ -58,7 +66,7 @@ def get_path(name: str) -> str:
     This function only works with example data and cannot handle
     paths to custom files.
     """
-    return _pooch.fetch(name)
+    return _get_pooch().fetch(name)
 
 
 def get_small_mtz_samples() -> list[pathlib.Path]:
@@ -67,5 +75,5 @@ def get_small_mtz_samples() -> list[pathlib.Path]:
 
     return [
         pathlib.Path(file_path)
-        for file_path in _pooch.fetch("mtz_samples.tar.gz", processor=Untar())
+        for file_path in _get_pooch().fetch("mtz_samples.tar.gz", processor=Untar())
     ]
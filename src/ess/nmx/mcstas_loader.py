@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: BSD-3-Clause
 # Copyright (c) 2023 Scipp contributors (https://github.com/scipp)
+import functools
+import os
 import re
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 
+import numpy as np
 import scipp as sc
 import scippnexus as snx
 
@@ -12,6 +16,7 @@ from .reduction import NMXData
 from .types import (
     CrystalRotation,
     DetectorBankPrefix,
+    DetectorCoords,
     DetectorIndex,
     DetectorName,
     EventData,
@@ -21,6 +26,14 @@ from .types import (
     RawEventData,
 )
 
+# Start of the detector component definition, contains the detector name.
+_DETECTOR_COMPONENT_REGEX = re.compile(
+    r'COMPONENT (?P<detector_name>\S+) = Monitor_nD\($', re.ASCII
+)
+# The line that defines the filename of the file that stores the
+# events associated with the detector.
+_BANK_NAME_REGEX = re.compile(r'filename = "(?P<bank_name>[^"]*)"')
+
 
 def detector_name_from_index(index: DetectorIndex) -> DetectorName:
     return f'nD_Mantid_{index}'
@@ -35,35 +48,41 @@ def event_data_bank_name(
             return bank_name.partition('.')[0]
 
 
+def detector_coords(
+    detector_name: DetectorName, instrument: McStasInstrument
+) -> DetectorCoords:
+    """Coordinates of the detector from the McStas instrument description.
+
+    The coordinates are shared by multiple providers and must not be modified.
+    """
+    return DetectorCoords(instrument.to_coords(detector_name))
+
+
 def raw_event_data(
     file_path: FilePath,
     bank_prefix: DetectorBankPrefix,
-    detector_name: DetectorName,
-    instrument: McStasInstrument,
+    coords: DetectorCoords,
 ) -> RawEventData:
     """Retrieve events from the nexus file."""
-    coords = instrument.to_coords(detector_name)
     bank_name = f'{bank_prefix}_dat_list_p_x_y_n_id_t'
     with snx.File(file_path, 'r') as f:
         root = f["entry1/data"]
         (bank_name,) = (name for name in root.keys() if bank_name in name)
-        data = root[bank_name]["events"][()].rename_dims({'dim_0': 'event'})
+        events = root[bank_name]["events"].dataset
+        # Only the probability, pixel id and time of arrival columns are used.
+        # They are read in one selection and unpacked as views of the same array.
+        probabilities, pixel_ids, tofs = events[:, [0, 4, 5]].T
         return sc.DataArray(
             coords={
                 PIXEL_DIM: sc.array(
                     dims=['event'],
-                    values=data['dim_1', 4].values,
-                    dtype='int64',
+                    values=pixel_ids.astype(np.int64, copy=False),
                     unit=None,
                 ),
-                TOF_DIM: sc.array(
-                    dims=['event'], values=data['dim_1', 5].values, unit='s'
-                ),
+                TOF_DIM: sc.array(dims=['event'], values=tofs, unit='s'),
             },
-            data=sc.array(
-                dims=['event'], values=data['dim_1', 0].values, unit='counts'
-            ),
-        ).group(coords.pop('pixel_id'))
+            data=sc.array(dims=['event'], values=probabilities, unit='counts'),
+        ).group(coords['pixel_id'])
 
 
 def crystal_rotation(
@@ -71,8 +90,9 @@ def crystal_rotation(
 ) -> CrystalRotation:
     """Retrieve crystal rotation from the file."""
     with snx.File(file_path, 'r') as file:
+        params = file["entry1/simulation/Param"]
         return sc.vector(
-            value=[file[f"entry1/simulation/Param/XtalPhi{key}"][...] for key in "XYZ"],
+            value=[params[f"XtalPhi{key}"][...] for key in "XYZ"],
             unit=instrument.simulation_settings.angle_unit,
         )
 
@@ -94,7 +114,9 @@ def event_weights_from_probability(
         The maximum probability to scale the weights.
 
     """
-    return sc.scalar(max_probability, unit='counts') * da / da.max()
+    # Fold the scalars first so that the events are only traversed once.
+    scale = sc.scalar(max_probability, unit='counts') / da.max().data
+    return EventData(scale * da)
 
 
 def proton_charge_from_event_data(da: EventData) -> ProtonCharge:
@@ -119,34 +141,53 @@ def proton_charge_from_event_data(da: EventData) -> ProtonCharge:
 
 
 def read_bank_names_to_detector_names(file_path: str) -> Dict[str, List[str]]:
+    # The modification time is part of the cache key
+    # so that a file overwritten at the same path is read again.
+    cached = _read_bank_names_to_detector_names(
+        os.path.abspath(file_path), os.stat(file_path).st_mtime_ns
+    )
+    return {bank_name: list(det_names) for bank_name, det_names in cached.items()}
+
+
+@functools.lru_cache(maxsize=8)
+def _read_bank_names_to_detector_names(
+    file_path: str, _mtime_ns: int
+) -> Mapping[str, Tuple[str, ...]]:
     with snx.File(file_path) as file:
         description = file['entry1/instrument/description'][()]
-    return bank_names_to_detector_names(description)
+    mapping = bank_names_to_detector_names(description)
+    # The result is shared by all callers, so it is stored as immutable.
+    return MappingProxyType({name: tuple(dets) for name, dets in mapping.items()})
 
 
 def bank_names_to_detector_names(description: str) -> Dict[str, List[str]]:
     """Associates event data names with the names of the detectors
     where the events were detected"""
 
-    detector_component_regex = (
-        # Start of the detector component definition, contains the detector name.
-        r'^COMPONENT (?P<detector_name>.*) = Monitor_nD\(\n'
-        # Some uninteresting lines, we're looking for 'filename'.
-        # Make sure no new component begins.
-        r'(?:(?!COMPONENT)(?!filename)(?:.|\s))*'
-        # The line that defines the filename of the file that stores the
-        # events associated with the detector.
-        r'(?:filename = \"(?P<bank_name>[^\"]*)\")?'
-    )
-    matches = re.finditer(detector_component_regex, description, re.MULTILINE)
     bank_names_to_detector_names = {}
-    for m in matches:
-        bank_names_to_detector_names.setdefault(
-            # If filename was not set for the detector the filename for the
-            # event data defaults to the name of the detector.
-            m.group('bank_name') or m.group('detector_name'),
-            [],
-        ).append(m.group('detector_name'))
+
+    def _add(bank_name: Optional[str], detector_name: str) -> None:
+        # If filename was not set for the detector the filename for the
+        # event data defaults to the name of the detector.
+        bank_name = bank_name or detector_name
+        bank_names_to_detector_names.setdefault(bank_name, []).append(detector_name)
+
+    # Name of the detector whose 'filename' line is still being looked for.
+    detector_name = None
+    for line in description.splitlines():
+        if 'COMPONENT' in line:
+            # A new component begins, the previous detector has no filename.
+            if detector_name is not None:
+                _add(None, detector_name)
+            match = _DETECTOR_COMPONENT_REGEX.match(line)
+            detector_name = match['detector_name'] if match else None
+        elif detector_name is not None and 'filename' in line:
+            match = _BANK_NAME_REGEX.search(line)
+            _add(match['bank_name'] if match else None, detector_name)
+            detector_name = None
+    if detector_name is not None:
+        _add(None, detector_name)
+
     return bank_names_to_detector_names
 
 
@@ -155,16 +196,13 @@ def load_mcstas(
     da: EventData,
     proton_charge: ProtonCharge,
     crystal_rotation: CrystalRotation,
-    detector_name: DetectorName,
-    instrument: McStasInstrument,
+    coords: DetectorCoords,
 ) -> NMXData:
-    coords = instrument.to_coords(detector_name)
-    coords.pop('pixel_id')
     return NMXData(
         weights=da,
         proton_charge=proton_charge,
         crystal_rotation=crystal_rotation,
-        **coords,
+        **{name: coord for name, coord in coords.items() if name != 'pixel_id'},
     )
 
 
@@ -172,6 +210,7 @@ providers = (
     read_mcstas_geometry_xml,
     detector_name_from_index,
     event_data_bank_name,
+    detector_coords,
     raw_event_data,
     event_weights_from_probability,
     proton_charge_from_event_data,
@@ -11,6 +11,9 @@ DetectorIndex = NewType("DetectorIndex", int)
 DetectorName = NewType("DetectorName", str)
 """Name of the detector to load"""
 
+DetectorCoords = NewType("DetectorCoords", dict[str, sc.Variable])
+"""Coordinates of the selected detector from the McStas instrument description"""
+
 DetectorBankPrefix = NewType("DetectorBankPrefix", str)
 """Prefix identifying the event data array containing
 the events from the selected detector"""
@@ -15,6 +15,7 @@ from ess.nmx.const import DETECTOR_DIM, DETECTOR_SHAPE
 from ess.nmx.data import small_mcstas_2_sample, small_mcstas_3_sample
 from ess.nmx.mcstas_loader import bank_names_to_detector_names
 from ess.nmx.mcstas_loader import providers as loader_providers
+from ess.nmx.mcstas_loader import read_bank_names_to_detector_names
 from ess.nmx.reduction import NMXData
 from ess.nmx.types import (
     DetectorBankPrefix,
@@ -194,6 +195,49 @@ def test_file_reader_mcstas_additional_fields(tmp_mcstas_file: pathlib.Path) ->
     assert isinstance(dg, sc.DataGroup)
 
 
+def _write_description(file_path: pathlib.Path, description: str) -> None:
+    import h5py
+
+    with h5py.File(file_path, 'w') as file:
+        file['entry1/instrument/description'] = description
+
+
+def test_read_bank_names_to_detector_names_cached(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    file_path = tmp_path / 'description.h5'
+    _write_description(file_path, two_detectors_two_filenames)
+    opened = []
+    original_file = snx.File
+
+    def _counting_file(*args, **kwargs):
+        opened.append(args[0])
+        return original_file(*args, **kwargs)
+
+    monkeypatch.setattr(snx, 'File', _counting_file)
+
+    first = read_bank_names_to_detector_names(str(file_path))
+    first.pop('bank01_events.dat')
+    first['bank02_events.dat'].append('nD_Mantid_2')
+    second = read_bank_names_to_detector_names(str(file_path))
+    assert len(opened) == 1
+    # Modifying a returned mapping does not affect later calls.
+    assert second == {
+        'bank01_events.dat': ['nD_Mantid_0'],
+        'bank02_events.dat': ['nD_Mantid_1'],
+    }
+
+    _write_description(file_path, two_detectors_same_filename)
+    # Make sure the modification time changes even on coarse-grained filesystems.
+    mtime_ns = os.stat(file_path).st_mtime_ns + 1_000_000_000
+    os.utime(file_path, ns=(mtime_ns, mtime_ns))
+    third = read_bank_names_to_detector_names(str(file_path))
+    assert len(opened) == 2
+    assert third == {'bank01_events.dat': ['nD_Mantid_0', 'nD_Mantid_1']}
+
+
 def test_bank_names_to_detector_names_two_detectors():
     res = bank_names_to_detector_names(two_detectors_two_filenames)
     assert len(res) == 2